@@ -1,29 +1,464 @@
 # Import all required libraries
-from azure.storage.blob import BlobServiceClient
+from __future__ import annotations
+
+from azure.storage.blob import BlobServiceClient, ContainerClient, BlobClient, BlobProperties
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.exceptions import ResourceExistsError
+from azure.core import MatchConditions
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import pandas as pd
+import asyncio
+import datetime
+import decimal
+import fractions
+import functools
+import hashlib
+import threading
+from dataclasses import dataclass
+from collections import OrderedDict
 import io
+import tempfile
 from dotenv import load_dotenv
-from typing import Optional, List, Union
+from typing import Optional, List, Tuple, Union, Dict, Iterator, TYPE_CHECKING
+
+# pandas and pyarrow are heavy - importing them takes a noticeable fraction of a second
+# They are imported inside the DataFrame/Arrow methods instead, so code which only moves blobs
+# (e.g. a serverless function doing upload_blob) starts faster
+# Python remembers modules after the first import, so later imports inside methods cost almost nothing
+# The block below is only read by type checkers and editors, it never runs
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+# ======================================================================================================================================
+# Shared client cache - builds Azure clients once per process and reuses them
+#
+# Creating a BlobServiceClient is surprisingly expensive:
+# It parses the connection string
+# It builds the account URLs
+# It sets up a whole HTTP pipeline (retries, authentication, logging)
+# Doing this on every AzureBlobStorage() is like cutting a new key every time you want to open the same door.
+# Instead we cut the key once and keep it on a hook by the door (functools.lru_cache).
+#
+# Thread-safety:
+# Azure SDK clients are documented as thread-safe, so one cached client can be shared between threads
+# Looking clients up happens under _CLIENT_POOL_LOCK, so two threads never build the same client twice
+_CLIENT_POOL_LOCK = threading.Lock()
+
+# Number of Azure hosts (e.g. different storage accounts) whose connection pools we keep
+_POOL_CONNECTIONS = os.cpu_count() or 4
+
+# How many open connections (sockets) we keep per Azure host
+# Every upload/download borrows a connection from this pool and gives it back afterwards
+_POOL_MAXSIZE = _POOL_CONNECTIONS * 4
+
+# One HTTP session shared by every client in this process
+# Without it each BlobServiceClient gets its own connection pool,
+# so every new client pays the TCP + TLS handshake again - like dialing a new phone call for every sentence
+_SHARED_SESSION = requests.Session()
+
+# Retries are disabled on the adapter on purpose
+# The Azure SDK has its own retry policy, we don't want two layers retrying the same request
+# pool_block=True - when all connections are busy, new requests wait for a free one
+# instead of opening extra sockets (too many sockets can exhaust the machine's outbound ports)
+# This is like a queue at a ticket office instead of everyone building their own office
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=_POOL_CONNECTIONS,
+    pool_maxsize=_POOL_MAXSIZE,
+    pool_block=True,
+    max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+)
+_SHARED_SESSION.mount("https://", _SHARED_ADAPTER)
+_SHARED_SESSION.mount("http://", _SHARED_ADAPTER)
+
+# Transport is the part of the SDK that actually sends HTTP requests
+# session_owner=False means a client closing itself will not close our shared session
+_SHARED_TRANSPORT = RequestsTransport(session=_SHARED_SESSION, session_owner=False)
+
+# Size of one piece of a CSV file parsed by a single CPU core
+_CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Transfer sizes used by the SDK when it splits large uploads and downloads
+# Bigger pieces mean fewer HTTP requests, like moving house with a van instead of a bicycle
+# Uploads up to this size are sent in one single request
+_MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+# Larger uploads are cut into blocks of this size (each parallel worker holds one block in memory)
+_MAX_BLOCK_SIZE = 32 * 1024 * 1024
+# Downloads fetch this much in the first request...
+_MAX_SINGLE_GET_SIZE = 32 * 1024 * 1024
+# ...and the rest in ranges of this size, several of them in parallel
+_MAX_CHUNK_GET_SIZE = 16 * 1024 * 1024
+
+# How many service clients (storage accounts) and container clients the process remembers
+# Oldest ones are forgotten first - a long-running service talking to changing accounts doesn't grow forever
+# All of them share _SHARED_TRANSPORT, so a forgotten client never takes the open connections with it
+_SERVICE_CLIENT_CACHE_SIZE = 8
+_CONTAINER_CLIENT_CACHE_SIZE = 64
+
+# How many BlobClient objects one AzureBlobStorage instance remembers
+# Oldest (least recently used) clients are forgotten first, so memory stays bounded
+_BLOB_CLIENT_CACHE_SIZE = 4096
+
+# How big a downloaded file may get before it is moved from memory to a temporary file on disk
+# Small files stay fast in RAM, huge files don't exhaust the memory
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# How many parallel connections are used to upload or download one large blob
+# The SDK splits a big file into blocks/ranges and transfers several of them at the same time
+_DEFAULT_MAX_CONCURRENCY = 8
+
+# How many downloads the async client runs at the same time
+# More parallel requests hide network latency, but too many would overload the connection
+_ASYNC_MAX_CONCURRENCY = 32
+
+# Maximum number of blob names Azure returns in one listing page
+_LIST_PAGE_SIZE = 5000
+
+# Maximum number of operations Azure accepts in one batch request
+_BATCH_SIZE = 256
+
+# Largest sheet Excel can open - rows (including the header row) and columns
+_EXCEL_MAX_ROWS = 1048576
+_EXCEL_MAX_COLUMNS = 16384
+
+# Suggested folder for the local download cache (pass it as cache_dir to AzureBlobStorage)
+# ~/.cache is the usual place for data a program can always fetch again
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'azure_integrator')
+
+@dataclass(frozen=True, slots=True)
+class _AzureEnv:
+    """
+    Configuration read from environment variables / .env file
+    frozen=True - values can't be changed by accident after loading
+    slots=True - no per-object dictionary, the object is small and fast to read
+    """
+    connection_string: Optional[str]
+    container_name: Optional[str]
+    prefix: Optional[str]
+    suffix: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def _env() -> _AzureEnv:
+    """
+    Loads the .env file and reads our environment variables only once per process
+    Returns:
+        _AzureEnv: Configuration values (None for variables which are not set)
+    """
+    # Reading .env means opening and parsing a file from disk
+    # The file does not change while the program runs, so once is enough
+    # Note: variables changed after the first call are not picked up - pass values as parameters instead
+    load_dotenv()
+    return _AzureEnv(
+        connection_string=os.getenv('AZURE_STORAGE_CONNECTION_STRING'),
+        container_name=os.getenv('CONTAINER_NAME'),
+        prefix=os.getenv('BLOB_PREFIX'),
+        suffix=os.getenv('BLOB_SUFFIX'),
+    )
+
+
+@functools.lru_cache(maxsize=_SERVICE_CLIENT_CACHE_SIZE)
+def _get_service_client(connection_string: str) -> BlobServiceClient:
+    """
+    Returns a cached BlobServiceClient for the given connection string
+    Args:
+        connection_string (str): Azure storage connection string
+    Returns:
+        BlobServiceClient: Client shared by every instance using the same connection string
+    """
+    # Main access point to the Azure Storage account
+    # Built only the first time we see this connection string
+    # All service clients send their requests through the one shared transport (connection pool)
+    # The size settings are inherited by every container and blob client created from it
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        transport=_SHARED_TRANSPORT,
+        max_single_put_size=_MAX_SINGLE_PUT_SIZE,
+        max_block_size=_MAX_BLOCK_SIZE,
+        max_single_get_size=_MAX_SINGLE_GET_SIZE,
+        max_chunk_get_size=_MAX_CHUNK_GET_SIZE,
+    )
+
+
+@functools.lru_cache(maxsize=_CONTAINER_CLIENT_CACHE_SIZE)
+def _get_container_client(connection_string: str, container_name: str) -> ContainerClient:
+    """
+    Returns a cached ContainerClient for the given connection string and container
+    Args:
+        connection_string (str): Azure storage connection string
+        container_name (str): Container name
+    Returns:
+        ContainerClient: Client shared by every instance using the same account and container
+    """
+    # Container client is built from the (also cached) service client
+    # so both of them share the same HTTP pipeline
+    return _get_service_client(connection_string).get_container_client(container_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_arrow_threads() -> None:
+    """
+    Sizes pyarrow's thread pools once per process, the first time an Arrow method is used
+    Set the PYARROW_THREADS environment variable to choose the number of decoding threads yourself
+    """
+    import pyarrow as pa
+    
+    # os.cpu_count() reports every core of the machine, even when a container (Azure Functions, AKS pod)
+    # may only use a few of them - sched_getaffinity tells how many cores this process can really run on
+    # Too many threads on too few cores only makes them wait for each other, like ten cooks in a tiny kitchen
+    available_cpus = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 4)
+    
+    # CPU pool - decodes and decompresses parquet/CSV columns and converts them to pandas
+    # PYARROW_THREADS wins over the detected number of cores
+    # It is checked only here, so a typo never affects code which doesn't use pyarrow
+    # _env() makes sure the .env file has been loaded, so the variable can live there too
+    _env()
+    cpu_threads = available_cpus
+    pyarrow_threads = os.getenv('PYARROW_THREADS')
+    if pyarrow_threads:
+        try:
+            cpu_threads = int(pyarrow_threads)
+        except ValueError:
+            cpu_threads = 0
+        if cpu_threads < 1:
+            raise ValueError(f"PYARROW_THREADS must be a positive integer, got '{pyarrow_threads}'. Check .env file")
+    pa.set_cpu_count(cpu_threads)
+    
+    # IO pool - threads which wait for data to be read, so more of them than cores is fine
+    pa.set_io_thread_count(min(16, 2 * available_cpus))
+
+
+def _df_to_table(dataframe: Union[pd.DataFrame, pa.Table]) -> pa.Table:
+    """
+    Converts a DataFrame to a pyarrow Table (an Arrow table is returned unchanged)
+    Args:
+        dataframe (pd.DataFrame or pa.Table): DataFrame to convert
+    Returns:
+        pa.Table: Arrow table without the pandas index
+    """
+    import pyarrow as pa
+    
+    if isinstance(dataframe, pa.Table):
+        return dataframe
+    
+    # preserve_index=False means don't include row numbers, same as index=False elsewhere
+    return pa.Table.from_pandas(dataframe, preserve_index=False)
+
+
+def _excel_value_converter():
+    """
+    Builds the function which converts one DataFrame value into something xlsxwriter can write
+    (same rules as pandas to_excel)
+    Returns:
+        function: Converter taking a cell value and returning the value to write (None means an empty cell)
+    """
+    # The converter runs once for every cell, so numpy and pandas are looked up here only once
+    import numpy as np
+    import pandas as pd
+    
+    def convert(value):
+        # Missing values (None, NaN, NaT, NA) become empty cells - same as pandas to_excel
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return None
+        
+        # NumPy values are turned into plain Python values
+        # (dates and durations through pandas, numpy's own .item() could turn them into plain integers)
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        elif isinstance(value, np.timedelta64):
+            value = pd.Timedelta(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        
+        # Numbers, text and dates are written as they are
+        # Excel has no "infinity" number, so it is written as text, like pandas does
+        if isinstance(value, float):
+            if value == float('inf'):
+                return 'inf'
+            if value == float('-inf'):
+                return '-inf'
+            return value
+        if isinstance(value, (bool, int, str, decimal.Decimal, fractions.Fraction)):
+            return value
+        if isinstance(value, (datetime.datetime, datetime.time)) and value.tzinfo is not None:
+            raise ValueError(
+                "Excel does not support datetimes with timezones. "
+                "Please ensure that datetimes are timezone unaware before writing to Excel."
+            )
+        
+        # Dates and date-times keep their type - df_to_excel gives each of them its own display format
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value
+        
+        # Durations are written as a number of days, like pandas does
+        if isinstance(value, datetime.timedelta):
+            return value.total_seconds() / 86400
+        
+        # Anything else (times of day, lists, UUIDs, periods, complex numbers, bytes...) is written as its text form
+        # This is like writing "see attachment" on a form field which only takes plain words
+        return str(value)
+    
+    return convert
+
+
+def _dedup_column_names(names: List[str]) -> List[str]:
+    """
+    Renames repeated column names the same way pd.read_csv does: a, a -> a, a.1
+    Args:
+        names (list): Column names from the CSV header
+    Returns:
+        list: Column names without repeats
+    """
+    # counts remembers how many times every name was used, so the next copy gets the next number
+    # A generated name which already appears in the header (e.g. a, a, a.1) is skipped - the copy becomes a.2
+    header = set(names)
+    counts: Dict[str, int] = {}
+    result = []
+    for name in names:
+        original = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in header else counts.get(name, 0)
+        result.append(name)
+        counts[name] = count + 1
+    return result
+
+
+def _parquet_bytes_to_df(data: bytes) -> pd.DataFrame:
+    """
+    Converts downloaded parquet bytes to a pandas DataFrame
+    Args:
+        data (bytes): Content of a parquet file
+    Returns:
+        pd.DataFrame: DataFrame containing the parquet data
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    _configure_arrow_threads()
+    
+    # BufferReader reads straight from the bytes we already have, without copying them into a file object
+    table = pq.read_table(pa.BufferReader(data), use_threads=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True, use_threads=True)
+
+
+def _run_async(coroutine_function, sync_name: str, async_name: str):
+    """
+    Runs an async function from normal (sync) code
+    Args:
+        coroutine_function: Async function without arguments to run
+        sync_name (str): Name of the sync method, used in the error message
+        async_name (str): Name of the matching AzureBlobStorageAsync method, used in the error message
+    Returns:
+        Whatever the async function returns
+    """
+    # asyncio.run() cannot start inside an event loop which is already running
+    # This happens for example in Jupyter notebooks - there the async class should be awaited directly
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            f"{sync_name}() cannot be used inside a running event loop (e.g. Jupyter). "
+            f"Use 'async with AzureBlobStorageAsync() as storage: await storage.{async_name}(blob_names)' instead"
+        )
+    return asyncio.run(coroutine_function())
+
+
+# ======================================================================================================================================
+# Bytearray writer - lets the SDK download straight into memory we prepared in advance
+
+class _BytearrayWriter(io.RawIOBase):
+    """
+    Minimal writable and seekable file-like object on top of a preallocated bytearray
+    The SDK's parallel download writes every chunk at its own position (seek + write),
+    so the bytearray is filled in place without any intermediate copies
+    """
+
+    def __init__(self, buffer: bytearray):
+        # memoryview lets us write into a slice of the bytearray without copying it
+        self._view = memoryview(buffer)
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        # Move the "cursor" - like placing the needle on a different spot of a record
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+        return self._position
+
+    def write(self, data) -> int:
+        # Copy the chunk into its place in the buffer and move the cursor after it
+        size = len(data)
+        self._view[self._position:self._position + size] = data
+        self._position += size
+        return size
 
 
 class AzureBlobStorage:
-    def __init__(self, connection_string: Optional[str] = None, container_name: Optional[str] = None):
+    # __slots__ lists every attribute an instance can have
+    # Python then stores them in a fixed, compact layout instead of a per-object dictionary
+    # This is like a form with labelled boxes instead of a blank notebook - smaller and faster to look up
+    __slots__ = (
+        'connection_string',
+        'container_name',
+        'max_concurrency',
+        '_blob_service_client',
+        '_container_client',
+        '_blob_client_cache',
+        '_blob_client_lock',
+        '_default_prefix',
+        '_default_suffix',
+        'cache_dir',
+    )
+
+    def __init__(self, connection_string: Optional[str] = None, container_name: Optional[str] = None,
+                 max_concurrency: int = _DEFAULT_MAX_CONCURRENCY, cache_dir: Optional[str] = None):
         """
         Initializes connection to Azure Blob Storage
         Args:
             connection_string (str, optional): Azure storage connection string, recommended to use .env file
             container_name (str, optional): Container name, recommended to use .env file
+            max_concurrency (int): Number of parallel connections used to upload or download one large blob
+            cache_dir (str, optional): Folder for a local copy of downloaded parquet files (e.g. DEFAULT_CACHE_DIR), None disables the cache
         """
         # Load environment variables from .env file
         # This allows us to store sensitive connection strings securely
-        load_dotenv()
+        # The file is parsed only on the first instance, later instances reuse the result
+        env = _env()
         
         # Get connection details
         # Can provide data in parameters or use .env file
         # Priority: parameter value > environment variable > None
-        self.connection_string = connection_string or os.getenv('AZURE_STORAGE_CONNECTION_STRING')
-        self.container_name = container_name or os.getenv('CONTAINER_NAME')
+        self.connection_string = connection_string or env.connection_string
+        self.container_name = container_name or env.container_name
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir
+        
+        # Default filters for blob listing, read once here instead of on every listing call
+        self._default_prefix = env.prefix
+        self._default_suffix = env.suffix
         
         # Data validation
         # If something is wrong with connection string or container name, return error
@@ -32,6 +467,57 @@ class AzureBlobStorage:
         if not self.container_name:
             raise ValueError("Missing container name. Check .env file or parameters")
             
+        # Clients are created on first use (see the blob_service_client and container_client properties)
+        # Creating an instance only reads settings - this keeps it instant when nothing is sent to Azure yet,
+        # e.g. when a scheduler only imports and configures the code
+        self._blob_service_client: Optional[BlobServiceClient] = None
+        self._container_client: Optional[ContainerClient] = None
+
+        # Small memory of BlobClient objects we already created
+        # Working with the same file many times does not rebuild its client every time
+        self._blob_client_cache: "OrderedDict[str, BlobClient]" = OrderedDict()
+        
+        # One instance may be used by several threads at once - the lock lets only one of them
+        # reorder or shrink the cache at a time, like one person at a time editing a shared list
+        self._blob_client_lock = threading.Lock()
+
+# ======================================================================================================================================
+    # Clients - open the connection to Azure the first time it is really needed
+    
+    @property
+    def blob_service_client(self) -> BlobServiceClient:
+        """
+        Client for the whole storage account, created on first access
+        Returns:
+            BlobServiceClient: Account-level client
+        """
+        if self._blob_service_client is None:
+            self._connect()
+        return self._blob_service_client
+
+    @blob_service_client.setter
+    def blob_service_client(self, client: BlobServiceClient) -> None:
+        self._blob_service_client = client
+
+    @property
+    def container_client(self) -> ContainerClient:
+        """
+        Client for our container, created on first access
+        Returns:
+            ContainerClient: Container-level client
+        """
+        if self._container_client is None:
+            self._connect()
+        return self._container_client
+
+    @container_client.setter
+    def container_client(self, client: ContainerClient) -> None:
+        self._container_client = client
+
+    def _connect(self) -> None:
+        """
+        Creates the account and container clients (only the ones which are still missing)
+        """
         # Attempt to open the door (try)
         # If something goes wrong (except):
         # Key doesn't fit
@@ -44,49 +530,175 @@ class AzureBlobStorage:
         # Informs user in a readable way what went wrong
         # Allows for appropriate error response
         try:
-            # Create client (connection) to Azure Storage Account using connection string
-            # This is the main access point to our Azure Storage account
-            # Allows for:
-            # Browsing all containers
-            # Creating new containers
-            # Managing permissions
-            # Executing operations at the account level
-            self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
-            
-            # Create client (connection) to specific container in Azure Storage
-            # Allows for:
-            # Browsing all objects (blobs) in the container
-            # Creating new objects
-            # Managing permissions
-            # Executing operations at the specific container level
-            self.container_client = self.blob_service_client.get_container_client(self.container_name)
+            # The lock makes sure two threads connecting at the same time still share one client
+            with _CLIENT_POOL_LOCK:
+                # Create client (connection) to Azure Storage Account using connection string
+                # This is the main access point to our Azure Storage account
+                # Allows for:
+                # Browsing all containers
+                # Creating new containers
+                # Managing permissions
+                # Executing operations at the account level
+                # The client comes from the shared cache, so it is created only once per connection string
+                if self._blob_service_client is None:
+                    self._blob_service_client = _get_service_client(self.connection_string)
+                
+                # Create client (connection) to specific container in Azure Storage
+                # Allows for:
+                # Browsing all objects (blobs) in the container
+                # Creating new objects
+                # Managing permissions
+                # Executing operations at the specific container level
+                # Also cached - every instance pointing at the same container reuses one client
+                if self._container_client is None:
+                    self._container_client = _get_container_client(self.connection_string, self.container_name)
         except Exception as e:
             # If connection fails, report error with information about what went wrong
             # str(e) shows details of the original error
             raise ConnectionError(f"Failed to connect to Azure Storage: {str(e)}")
 
+# ======================================================================================================================================
+    # Blob client cache - remembers clients for files we already worked with
+    
+    def _blob_client(self, blob_name: str) -> BlobClient:
+        """
+        Returns a cached BlobClient for the given blob, creating it on first use
+        Args:
+            blob_name (str): Name of the blob
+        Returns:
+            BlobClient: Client for the specific blob
+        """
+        # Without the lock another thread could forget this client between get() and move_to_end()
+        with self._blob_client_lock:
+            # Check if we already have a client for this file
+            # move_to_end marks it as "recently used" so it is evicted last
+            blob_client = self._blob_client_cache.get(blob_name)
+            if blob_client is not None:
+                self._blob_client_cache.move_to_end(blob_name)
+                return blob_client
+            
+            # First time we see this file - build its client and remember it
+            # This is like writing down the exact address of a file so we don't have to look it up again
+            blob_client = self.container_client.get_blob_client(blob_name)
+            self._blob_client_cache[blob_name] = blob_client
+            
+            # Cache is full - forget the least recently used client
+            if len(self._blob_client_cache) > _BLOB_CLIENT_CACHE_SIZE:
+                self._blob_client_cache.popitem(last=False)
+            return blob_client
+
 # ======================================================================================================================================
     # Listing blobs - shows all files in our container
+    #
+    # Note on errors in the blob methods (listing, upload, download, delete, DataFrame conversions):
+    # They don't wrap errors into RuntimeError - Azure's own exceptions are passed on unchanged,
+    # e.g. azure.core.exceptions.ResourceNotFoundError when a file doesn't exist
+    # This way the caller can catch exactly the problem it knows how to handle,
+    # like a doctor getting the exact diagnosis instead of just "the patient is unwell"
     
-    def blob_list(self) -> List[str]:
+    def blob_list(self, prefix: Optional[str] = None, suffix: Optional[Union[str, Tuple[str, ...], List[str]]] = None,
+                  results_per_page: int = _LIST_PAGE_SIZE) -> List[str]:
         """
         Lists all blobs in the container
+        Args:
+            prefix (str, optional): Only list blobs whose names start with this text, e.g. 'sales/2024/'
+                                    Defaults to the BLOB_PREFIX environment variable
+            suffix (str or tuple, optional): Only list blobs whose names end with this text, e.g. '.parquet'
+                                    or with any of several endings, e.g. ('.parquet', '.pq')
+                                    Defaults to the BLOB_SUFFIX environment variable
+            results_per_page (int): How many names Azure sends back in one page (max 5000)
         Returns:
             list: List of blob names in the container
         """
-        try:
-            # Get list of all blobs (files) in the container
-            # This is like asking "what files do you have in this folder?"
-            blobs = self.container_client.list_blobs()
-            
-            # Extract just the names from blob objects
-            # Convert from complex blob objects to simple list of names
-            blob_names = [blob.name for blob in blobs]
-            
-            return blob_names
-        except Exception as e:
-            # If something goes wrong, inform user with clear error message
-            raise RuntimeError(f"Error listing blobs: {str(e)}")
+        # Collect all names from the generator into a list
+        # Use iter_blob_names() directly if you don't need all names at once
+        return list(self.iter_blob_names(prefix=prefix, suffix=suffix, results_per_page=results_per_page))
+
+    def iter_blob_names(self, prefix: Optional[str] = None, suffix: Optional[Union[str, Tuple[str, ...], List[str]]] = None,
+                        results_per_page: int = _LIST_PAGE_SIZE) -> Iterator[str]:
+        """
+        Yields names of blobs in the container one by one, page after page
+        Memory use stays at one page of names, no matter how big the container is
+        Args:
+            prefix (str, optional): Only list blobs whose names start with this text, e.g. 'sales/2024/'
+                                    Defaults to the BLOB_PREFIX environment variable
+            suffix (str or tuple, optional): Only list blobs whose names end with this text, e.g. '.parquet'
+                                    or with any of several endings, e.g. ('.parquet', '.pq')
+                                    Defaults to the BLOB_SUFFIX environment variable
+            results_per_page (int): How many names Azure sends back in one page (max 5000)
+        Yields:
+            str: Blob name
+        """
+        # No prefix/suffix given - fall back to the defaults read in __init__
+        prefix = prefix if prefix is not None else self._default_prefix
+        suffix = self._resolve_suffix(suffix)
+        
+        # Get blobs (files) in the container
+        # This is like asking "what files do you have in this folder?"
+        # name_starts_with filters on the Azure side, so files we don't want are never sent to us
+        # Bigger pages mean fewer round trips to Azure when the container is large
+        # list_blob_names gives us plain strings - list_blobs would build a full BlobProperties object
+        # (size, dates, metadata...) for every file, only for us to throw everything but the name away
+        names = self.container_client.list_blob_names(name_starts_with=prefix, results_per_page=results_per_page)
+        
+        # Hand out names one at a time as pages arrive
+        # The caller can stop early (break) without downloading the remaining pages
+        # Azure can only filter by the beginning of a name, so the ending is checked here
+        # This is like the post office sorting by street, and us picking our house number from the pile
+        for name in names:
+            if not suffix or name.endswith(suffix):
+                yield name
+
+    def list_blobs_detailed(self, prefix: Optional[str] = None, suffix: Optional[Union[str, Tuple[str, ...], List[str]]] = None,
+                            results_per_page: int = _LIST_PAGE_SIZE) -> List[BlobProperties]:
+        """
+        Lists blobs in the container together with their properties (size, last modified, content type...)
+        Use blob_list() when you only need the names - it is faster
+        Args:
+            prefix (str, optional): Only list blobs whose names start with this text, defaults to BLOB_PREFIX
+            suffix (str or tuple, optional): Only list blobs whose names end with this text (or any of these texts),
+                                             defaults to BLOB_SUFFIX
+            results_per_page (int): How many blobs Azure sends back in one page (max 5000)
+        Returns:
+            list: BlobProperties objects of the blobs
+        """
+        # Same defaults and filters as iter_blob_names, but every file comes with its full description
+        prefix = prefix if prefix is not None else self._default_prefix
+        suffix = self._resolve_suffix(suffix)
+        
+        blobs = self.container_client.list_blobs(name_starts_with=prefix, results_per_page=results_per_page)
+        return [blob for blob in blobs if not suffix or blob.name.endswith(suffix)]
+
+    def find_by_tag(self, tag_filter: str) -> List[str]:
+        """
+        Finds blobs in the container by their index tags
+        Args:
+            tag_filter (str): Tag condition in Azure syntax, e.g. "project"='sales' AND "year">='2024'
+        Returns:
+            list: Names of the blobs whose tags match
+        """
+        # Tags are small key=value labels stored on a blob, and Azure keeps an index of them
+        # Listing + filtering has to look at every name under the prefix, even if only a handful match
+        # A tag query asks the index directly and only the matching blobs are sent back
+        # This is like asking the librarian for "all books by this author" instead of walking along every shelf
+        return [blob.name for blob in self.container_client.find_blobs_by_tags(tag_filter)]
+
+    def _resolve_suffix(self, suffix: Optional[Union[str, Tuple[str, ...], List[str]]]) -> Optional[Union[str, Tuple[str, ...]]]:
+        """
+        Applies the default suffix and turns a list of suffixes into a tuple
+        Args:
+            suffix (str, tuple or list, optional): Suffix (or suffixes) given by the caller
+        Returns:
+            str or tuple: Value ready for str.endswith, None when there is nothing to filter
+        """
+        suffix = suffix if suffix is not None else self._default_suffix
+        
+        # str.endswith accepts a tuple and checks every ending in one call (in C, stopping at the first match)
+        # so asking for '.parquet' or '.pq' costs one pass over the names instead of one listing per ending
+        # It doesn't accept a list, so a list is turned into a tuple first
+        if isinstance(suffix, list):
+            suffix = tuple(suffix)
+        return suffix
 
 # ======================================================================================================================================
     # Creating container - makes new storage folders in Azure
@@ -100,21 +712,15 @@ class AzureBlobStorage:
             str: Message indicating result
         """
         try:
-            # Get list of all existing containers in the storage account
-            # This is like checking what folders already exist
-            containers = self.blob_service_client.list_containers()
-            existing_containers = [container.name for container in containers]
-            
-            # Check if the container we want to create already exists
-            # Prevent creating duplicate containers
-            if new_container not in existing_containers:
-                # Create the new container since it doesn't exist
-                # This is like creating a new folder in the cloud
-                self.blob_service_client.create_container(new_container)
-                return f"Container '{new_container}' created successfully"
-            else:
-                # Container already exists, inform user
-                return f"Container '{new_container}' already exists"
+            # Simply try to create the container in one request
+            # We don't list all containers first - that would download the whole list
+            # (possibly many pages) just to answer one yes/no question
+            # This is like trying to create a new folder and letting the system tell us if it already exists
+            self.blob_service_client.create_container(new_container)
+            return f"Container '{new_container}' created successfully"
+        except ResourceExistsError:
+            # Azure told us the container already exists, inform user
+            return f"Container '{new_container}' already exists"
         except Exception as e:
             # If creation fails, provide clear error message
             raise RuntimeError(f"Error creating container: {str(e)}")
@@ -166,29 +772,35 @@ class AzureBlobStorage:
 # ======================================================================================================================================
     # Upload blob - sends files to Azure storage
     
-    def upload_blob(self, blob_name: str, data: Union[str, bytes, io.IOBase], overwrite: bool = False) -> str:
+    def upload_blob(self, blob_name: str, data: Union[str, bytes, io.IOBase], overwrite: bool = False,
+                    length: Optional[int] = None, max_concurrency: Optional[int] = None) -> str:
         """
         Uploads data to a blob
         Args:
             blob_name (str): Name of the blob
             data: Data to upload (string, bytes, or file-like object)
             overwrite (bool): Whether to overwrite existing blob
+            length (int, optional): Number of bytes to upload, useful for file-like objects whose size is already known
+            max_concurrency (int, optional): Number of blocks uploaded in parallel, defaults to the instance setting
         Returns:
             str: Message indicating result
         """
-        try:
-            # Get a client for the specific blob we want to upload
-            # This is like selecting the file location where we want to save
-            blob_client = self.container_client.get_blob_client(blob_name)
-            
-            # Upload the data to Azure blob storage
-            # overwrite parameter controls if we replace existing files
-            # This is like copying a file to the cloud
-            blob_client.upload_blob(data, overwrite=overwrite)
-            return f"Blob '{blob_name}' uploaded successfully"
-        except Exception as e:
-            # If upload fails, provide clear error message
-            raise RuntimeError(f"Error uploading blob: {str(e)}")
+        # Get a client for the specific blob we want to upload
+        # This is like selecting the file location where we want to save
+        blob_client = self._blob_client(blob_name)
+        
+        # Upload the data to Azure blob storage
+        # overwrite parameter controls if we replace existing files
+        # This is like copying a file to the cloud
+        # length=None lets the SDK measure the data itself
+        # Large files are sent as several blocks at the same time (max_concurrency)
+        blob_client.upload_blob(
+            data,
+            overwrite=overwrite,
+            length=length,
+            max_concurrency=max_concurrency or self.max_concurrency,
+        )
+        return f"Blob '{blob_name}' uploaded successfully"
 
 # ======================================================================================================================================
     # Download blob - gets files from Azure storage
@@ -201,18 +813,108 @@ class AzureBlobStorage:
         Returns:
             bytes: Blob content
         """
-        try:
-            # Get a client for the specific blob we want to download
-            # This is like selecting which file we want to retrieve
-            blob_client = self.container_client.get_blob_client(blob_name)
+        # Download the blob content as binary data into a prepared buffer
+        # This is like downloading a file from cloud to memory
+        return bytes(self._download_to_buffer(blob_name))
+
+# ======================================================================================================================================
+    # Download many blobs - gets a whole batch of files from Azure at the same time
+    
+    def download_blobs(self, blob_names: List[str]) -> Dict[str, bytes]:
+        """
+        Downloads many blobs concurrently using the async client
+        Args:
+            blob_names (list): Names of the blobs to download
+        Returns:
+            dict: Mapping of blob name to its content (bytes)
+        """
+        async def _download_all() -> Dict[str, bytes]:
+            # Open the async client, download everything, and close the client when done
+            async with AzureBlobStorageAsync(self.connection_string, self.container_name) as async_storage:
+                return await async_storage.download_many(blob_names)
+        
+        # Downloading files one by one means waiting for each network round trip in turn
+        # Async downloads them side by side - like sending many couriers at once instead of one courier many times
+        return _run_async(_download_all, 'download_blobs', 'download_many')
+
+# ======================================================================================================================================
+    # Download stream - gets files from Azure piece by piece instead of all at once
+    
+    def _download_stream(self, blob_name: str):
+        """
+        Starts downloading a blob and returns the SDK downloader
+        Args:
+            blob_name (str): Name of the blob to download
+        Returns:
+            StorageStreamDownloader: Object which can write the blob content into a file-like object
+        """
+        # This only starts the download - the data arrives when we read from the downloader
+        # Think of it as opening a tap, the water flows only when we hold a bucket under it
+        # max_concurrency lets the SDK fetch several parts of a large file at the same time
+        return self._blob_client(blob_name).download_blob(max_concurrency=self.max_concurrency)
+
+    def _download_to_buffer(self, blob_name: str) -> bytearray:
+        """
+        Downloads a blob into a bytearray allocated up front with the exact blob size
+        Args:
+            blob_name (str): Name of the blob to download
+        Returns:
+            bytearray: Blob content
+        """
+        # The downloader already knows the size of the file from the first response
+        # so we can reserve exactly the memory we need - like booking a table for the right number of guests
+        downloader = self._download_stream(blob_name)
+        buffer = bytearray(downloader.size)
+        
+        # Parallel chunks are written straight into their place in the buffer
+        downloader.readinto(_BytearrayWriter(buffer))
+        return buffer
+
+    def _cached_blob_path(self, blob_name: str) -> str:
+        """
+        Returns the path of a local copy of the blob, downloading it first if the copy is missing or outdated
+        Args:
+            blob_name (str): Name of the blob
+        Returns:
+            str: Path of the local file with the blob content
+        """
+        # ETag is a version stamp Azure gives every blob - it changes whenever the blob is overwritten
+        # Asking for it is a tiny request, much cheaper than downloading the whole file again
+        # Copies are stored as <cache_dir>/<container>/<etag>/<hash of blob name>, so a new version simply gets a new folder
+        # Note: old versions are not removed automatically - delete the cache folder to free the disk space
+        blob_client = self._blob_client(blob_name)
+        etag = blob_client.get_blob_properties().etag
+        
+        # The file name is a hash (fingerprint) of the blob name, not the name itself
+        # Azure names are not real folders: 'a' and 'a/b' can both exist, but on disk 'a' can't be a file and a folder at once
+        # A hash is always one plain file name - no folders, no '..', never too long - like a cloakroom ticket number
+        file_name = hashlib.sha256(blob_name.encode('utf-8')).hexdigest()
+        version_dir = os.path.join(self.cache_dir, self.container_name, etag.strip('"'))
+        path = os.path.join(version_dir, file_name)
+        
+        if not os.path.exists(path):
+            os.makedirs(version_dir, exist_ok=True)
             
-            # Download the blob content as binary data
-            # readall() gets the entire file content at once
-            # This is like downloading a file from cloud to memory
-            return blob_client.download_blob().readall()
-        except Exception as e:
-            # If download fails, provide clear error message
-            raise RuntimeError(f"Error downloading blob: {str(e)}")
+            # IfNotModified - Azure refuses the download if the blob changed after we read its ETag,
+            # so a file in the folder of one version never contains data of another version
+            downloader = blob_client.download_blob(
+                max_concurrency=self.max_concurrency,
+                etag=etag,
+                match_condition=MatchConditions.IfNotModified,
+            )
+            
+            # Download into a temporary file first and rename it when complete
+            # Renaming is atomic, so an interrupted download never leaves a half-written file in the cache
+            fd, temp_path = tempfile.mkstemp(dir=version_dir, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as temp_file:
+                    downloader.readinto(temp_file)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        
+        return path
 
 # ======================================================================================================================================
     # Delete blob - removes files from Azure storage
@@ -225,159 +927,686 @@ class AzureBlobStorage:
         Returns:
             str: Message indicating result
         """
-        try:
-            # Get a client for the specific blob we want to delete
-            # This is like selecting which file we want to remove
-            blob_client = self.container_client.get_blob_client(blob_name)
-            
-            # Delete the blob from Azure storage
-            # This permanently removes the file from the cloud
-            blob_client.delete_blob()
-            return f"Blob '{blob_name}' deleted successfully"
-        except Exception as e:
-            # If deletion fails, provide clear error message
-            raise RuntimeError(f"Error deleting blob: {str(e)}")
+        # Get a client for the specific blob we want to delete
+        # This is like selecting which file we want to remove
+        blob_client = self._blob_client(blob_name)
+        
+        # Delete the blob from Azure storage
+        # This permanently removes the file from the cloud
+        blob_client.delete_blob()
+        return f"Blob '{blob_name}' deleted successfully"
+
+# ======================================================================================================================================
+    # Delete many blobs - removes a whole list of files with as few requests as possible
+    
+    def delete_blobs(self, blob_names: List[str]) -> str:
+        """
+        Deletes many blobs using batch requests (up to 256 blobs per request)
+        Args:
+            blob_names (list): Names of the blobs to delete
+        Returns:
+            str: Message indicating result
+        """
+        # Deleting files one by one costs one network round trip per file
+        # A batch packs up to 256 deletes into a single request
+        # This is like posting one envelope with 256 letters instead of 256 separate envelopes
+        for start in range(0, len(blob_names), _BATCH_SIZE):
+            self.container_client.delete_blobs(*blob_names[start:start + _BATCH_SIZE])
+        return f"{len(blob_names)} blobs deleted successfully"
+
+# ======================================================================================================================================
+    # Set blob tier - moves many files between Hot, Cool and Archive storage
+    
+    def set_blob_tier(self, blob_names: List[str], tier: str) -> str:
+        """
+        Changes the access tier of many blobs using batch requests (up to 256 blobs per request)
+        Args:
+            blob_names (list): Names of the blobs to change
+            tier (str): Target access tier, e.g. 'Hot', 'Cool' or 'Archive'
+        Returns:
+            str: Message indicating result
+        """
+        # Access tier decides price and speed of a file
+        # Hot - fast and more expensive, Archive - cheap but needs hours to read back
+        # Same batching as in delete_blobs: one request per 256 files
+        for start in range(0, len(blob_names), _BATCH_SIZE):
+            self.container_client.set_standard_blob_tier_blobs(tier, *blob_names[start:start + _BATCH_SIZE])
+        return f"Tier of {len(blob_names)} blobs set to '{tier}' successfully"
 
 # ======================================================================================================================================
     # Create DataFrames from parquet files - converts Azure files to pandas tables
     
-    def parquet_to_df(self, blob_name: str) -> pd.DataFrame:
+    def parquet_to_df(self, blob_name: str, columns: Optional[List[str]] = None,
+                      filters: Optional[list] = None) -> pd.DataFrame:
         """
         Downloads a parquet file from blob storage and converts it to a pandas DataFrame
         Args:
             blob_name (str): Name of the parquet blob
+            columns (list, optional): Only these columns are read, None reads all of them
+            filters (list, optional): Row filters, e.g. [('date', '>=', '2024-01-01')] (see parquet_to_arrow)
         Returns:
             pd.DataFrame: DataFrame containing the parquet data
         """
+        # Read the parquet file as an Arrow table first, then convert it to pandas
+        # self_destruct=True is safe here - nobody else holds this table,
+        # so its memory can be released column by column during conversion
+        table = self.parquet_to_arrow(blob_name, columns=columns, filters=filters)
+        return self.df_from_arrow(table, self_destruct=True)
+
+# ======================================================================================================================================
+    # Create many DataFrames from parquet files - downloads and converts a batch of files at the same time
+    
+    def parquet_to_dfs(self, blob_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Downloads many parquet files concurrently and converts each of them to a pandas DataFrame
+        Args:
+            blob_names (list): Names of the parquet blobs
+        Returns:
+            dict: Mapping of blob name to its DataFrame
+        """
+        async def _read_all() -> Dict[str, pd.DataFrame]:
+            # Open the async client, read everything, and close the client when done
+            async with AzureBlobStorageAsync(self.connection_string, self.container_name) as async_storage:
+                return await async_storage.read_parquet_many(blob_names)
+        
+        # While one file is being converted, the next ones are already downloading
+        return _run_async(_read_all, 'parquet_to_dfs', 'read_parquet_many')
+
+# ======================================================================================================================================
+    # Create one DataFrame from a folder of parquet files - lets pyarrow read all the files in parallel
+    
+    def read_parquet_dataset(self, prefix: str, columns: Optional[List[str]] = None,
+                             filters: Optional[list] = None) -> pd.DataFrame:
+        """
+        Reads every parquet file under a prefix (a "folder" in the container) into one pandas DataFrame
+        Args:
+            prefix (str): Folder to read, e.g. 'sales/2024/'
+            columns (list, optional): Only these columns are read, None reads all of them
+            filters (list, optional): Row filters, e.g. [('date', '>=', '2024-01-01')] (same format as parquet_to_arrow)
+        Returns:
+            pd.DataFrame: DataFrame with the rows of all files
+        """
+        # adlfs lets pyarrow talk to Azure as if it were a normal disk
+        # Only this method needs it, so users who never read whole folders don't have to install it
         try:
-            # Download the parquet file from Azure as binary data
-            # Think of it as downloading a file from cloud to memory
-            blob_data = self.download_blob(blob_name)
-            
-            # Convert binary data to pandas DataFrame
-            # io.BytesIO creates a file-like object from bytes in memory
-            # pd.read_parquet reads the parquet format and creates DataFrame
-            return pd.read_parquet(io.BytesIO(blob_data))
-        except Exception as e:
-            # If conversion fails, provide clear error message
-            raise RuntimeError(f"Error converting parquet to DataFrame: {str(e)}")
+            from adlfs import AzureBlobFileSystem
+        except ImportError:
+            raise ImportError("Reading parquet datasets requires the 'adlfs' package. Install it with: pip install adlfs")
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        
+        _configure_arrow_threads()
+        
+        # A dataset treats many files as one big table
+        # pyarrow lists the files, reads their footers and fetches column data for several files at the same time,
+        # instead of us downloading and converting the files one after another in a Python loop
+        # This is like a team of librarians fetching books from many shelves at once
+        filesystem = AzureBlobFileSystem(connection_string=self.connection_string)
+        dataset = ds.dataset(f"{self.container_name}/{prefix}", filesystem=filesystem, format='parquet')
+        
+        # Row filters in list form are turned into an Arrow expression which the dataset understands
+        # Row groups (and whole files) which can't match are skipped using their statistics
+        if filters is not None and not isinstance(filters, ds.Expression):
+            filters = pq.filters_to_expression(filters)
+        
+        table = dataset.to_table(columns=columns, filter=filters, use_threads=True)
+        
+        # Nobody else holds the table, so its memory can be released during conversion
+        return self.df_from_arrow(table, self_destruct=True)
+
+# ======================================================================================================================================
+    # Create Arrow tables from parquet files - reads Azure files without going through pandas
+    
+    def parquet_to_arrow(self, blob_name: str, columns: Optional[List[str]] = None,
+                         filters: Optional[list] = None) -> pa.Table:
+        """
+        Downloads a parquet file from blob storage and reads it as a pyarrow Table
+        Use this when you only need to filter, select or aggregate columns - it skips the pandas conversion
+        Args:
+            blob_name (str): Name of the parquet blob
+            columns (list, optional): Only these columns are read, None reads all of them
+            filters (list, optional): Row filters as (column, operator, value) tuples, e.g. [('date', '>=', '2024-01-01')]
+                A list of such lists means OR between the inner lists
+        Returns:
+            pa.Table: Arrow table containing the parquet data
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        # Make sure Arrow uses as many threads as we have cores (done once per process)
+        _configure_arrow_threads()
+        
+        # Parquet stores every column separately and keeps min/max statistics for each group of rows
+        # columns= skips decoding the columns we don't need, filters= skips whole row groups which can't match
+        # This is like reading only the chapters you need, guided by the table of contents
+        
+        if self.cache_dir:
+            # With the local cache the file is downloaded only when it changed in Azure
+            # memory_map=True lets the operating system page the file in on demand instead of reading it all into memory
+            return pq.read_table(
+                self._cached_blob_path(blob_name),
+                columns=columns,
+                filters=filters,
+                memory_map=True,
+                use_threads=True,
+            )
+        
+        # Download the parquet file from Azure into a bytearray of exactly the right size
+        # py_buffer wraps that memory without copying it, and BufferReader lets parquet read from it like from a file
+        # Think of it as reading the book where it lies instead of photocopying it first
+        buffer = pa.py_buffer(self._download_to_buffer(blob_name))
+        
+        # Arrow reads parquet columns directly into its own columnar memory
+        # Converting to pandas often costs more than reading the file itself
+        # use_threads=True decodes several columns at the same time on different CPU cores
+        return pq.read_table(pa.BufferReader(buffer), columns=columns, filters=filters, use_threads=True)
+
+# ======================================================================================================================================
+    # Create DataFrames from Arrow tables - converts Arrow columns to pandas with as few copies as possible
+    
+    def df_from_arrow(self, table: pa.Table, use_arrow_dtypes: bool = False, self_destruct: bool = False) -> pd.DataFrame:
+        """
+        Converts a pyarrow Table to a pandas DataFrame
+        Args:
+            table (pa.Table): Arrow table to convert
+            use_arrow_dtypes (bool): Keep Arrow-backed pandas columns (pd.ArrowDtype) instead of NumPy ones,
+                                     which avoids converting the data at all
+            self_destruct (bool): Release the table's memory during conversion (halves peak memory),
+                                  the table must NOT be used afterwards
+        Returns:
+            pd.DataFrame: DataFrame containing the table data
+        """
+        import pandas as pd
+        
+        _configure_arrow_threads()
+        
+        # split_blocks=True gives every column its own memory block
+        # pandas doesn't have to glue same-type columns into one big block (a full extra copy)
+        # This is like putting books on the shelf one by one instead of first binding them together
+        return table.to_pandas(
+            split_blocks=True,
+            self_destruct=self_destruct,
+            types_mapper=pd.ArrowDtype if use_arrow_dtypes else None,
+            # Columns are converted in parallel on the Arrow CPU pool
+            use_threads=True,
+        )
 
 # ======================================================================================================================================
     # Create Excel files from DataFrames - converts pandas tables to Excel format and uploads to Azure
     
-    def df_to_excel(self, dataframe: pd.DataFrame, blob_name: str) -> str:
+    def df_to_excel(self, dataframe: Union[pd.DataFrame, pa.Table], blob_name: str) -> str:
         """
         Converts a DataFrame to Excel format and uploads it as a blob
+        Note: Excel is slow to write and produces large files.
+        If the file is meant for analytics rather than for people opening it in Excel, use df_to_parquet instead.
         Args:
-            dataframe (pd.DataFrame): DataFrame to convert
+            dataframe (pd.DataFrame or pa.Table): DataFrame (or Arrow table) to convert
             blob_name (str): Name for the Excel blob (should end with .xlsx)
         Returns:
             str: Message indicating result
         """
+        # xlsxwriter is only needed for Excel files, so we import it here
+        # Users who never write Excel don't have to install it
         try:
-            # Create a memory buffer to store Excel file
-            # Think of it as creating a temporary file in memory
-            buffer = io.BytesIO()
+            import xlsxwriter
+        except ImportError:
+            raise ImportError("Writing Excel files requires the 'xlsxwriter' package. Install it with: pip install xlsxwriter")
+        import pyarrow as pa
+        
+        # Arrow tables are written without converting them to pandas first
+        # Each batch of rows is turned into Python values column by column and then zipped into rows
+        if isinstance(dataframe, pa.Table):
+            column_names = dataframe.column_names
+            row_count = dataframe.num_rows
+            rows = (
+                row
+                for batch in dataframe.to_batches()
+                for row in zip(*(column.to_pylist() for column in batch.columns))
+            )
+        else:
+            # index=False equivalent - itertuples(index=False) skips row numbers
+            column_names = dataframe.columns
+            row_count = len(dataframe)
+            rows = dataframe.itertuples(index=False, name=None)
+        
+        # Excel can't hold more than 1,048,576 rows (header included) or 16,384 columns
+        # xlsxwriter would just skip the rows which don't fit, so we stop here instead of uploading a cut-off file
+        if row_count + 1 > _EXCEL_MAX_ROWS or len(column_names) > _EXCEL_MAX_COLUMNS:
+            raise ValueError(
+                f"This sheet is too large! Your sheet size is: {row_count + 1}, {len(column_names)} "
+                f"Max sheet size is: {_EXCEL_MAX_ROWS}, {_EXCEL_MAX_COLUMNS}. Use df_to_parquet for data this big"
+            )
+        
+        # Create a temporary file to store Excel file
+        # It stays in memory while small and moves to disk when it grows above _SPOOL_MAX_SIZE
+        # Think of it as a scratch pad which turns into a folder when the notes get too long
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            # constant_memory=True writes every finished row out immediately
+            # instead of keeping the whole sheet as millions of Python cell objects
+            # This is like printing a long report page by page instead of holding all pages in your hands
+            # strings_to_urls/strings_to_numbers=False - text is written as plain text
+            # otherwise xlsxwriter would check every single text cell whether it looks like a link or a number
+            workbook = xlsxwriter.Workbook(buffer, {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+                'strings_to_urls': False,
+                'strings_to_numbers': False,
+            })
+            worksheet = workbook.add_worksheet()
+            
+            # Plain dates (without time) are shown as yyyy-mm-dd, like pandas does
+            # default_date_format above is used for date-times (datetime, pandas Timestamp)
+            # The handler is called only for cells holding exactly a datetime.date
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+            worksheet.add_write_handler(
+                datetime.date,
+                lambda sheet, row, col, value, cell_format=None: sheet.write_datetime(row, col, value, date_format),
+            )
             
-            # Convert DataFrame to Excel format and write to buffer
-            # index=False means don't include row numbers in Excel
-            dataframe.to_excel(buffer, index=False)
+            # First row - column names in bold, like pandas does
+            worksheet.write_row(0, 0, [str(column) for column in column_names], workbook.add_format({'bold': True}))
             
-            # Reset buffer position to beginning
+            # Write the data row by row
+            # constant_memory mode only accepts rows in order (pandas to_excel writes column by column,
+            # which would silently lose data in this mode, so we write the rows ourselves)
+            excel_value = _excel_value_converter()
+            for row_number, row in enumerate(rows, start=1):
+                worksheet.write_row(row_number, 0, [excel_value(value) for value in row])
+            
+            # Closing the workbook writes the final .xlsx file into the buffer
+            workbook.close()
+            
+            # Remember how many bytes we wrote, then reset position to beginning
             # This is like rewinding a tape to the start
+            length = buffer.tell()
             buffer.seek(0)
             
             # Upload the Excel file to Azure blob storage
+            # We pass the buffer itself, not buffer.getvalue() - getvalue() would make a second full copy
+            # The SDK reads the buffer piece by piece, like pouring from a jug instead of first filling another jug
+            # Giving the length up front means the SDK doesn't have to inspect the file to measure it
             # overwrite=True means replace file if it already exists
-            return self.upload_blob(blob_name, buffer.getvalue(), overwrite=True)
-        except Exception as e:
-            # If conversion or upload fails, provide clear error message
-            raise RuntimeError(f"Error converting DataFrame to Excel: {str(e)}")
+            return self.upload_blob(blob_name, buffer, overwrite=True, length=length)
 
 # ======================================================================================================================================
     # Create Parquet files from DataFrames - converts pandas tables to efficient Parquet format
     
-    def df_to_parquet(self, dataframe: pd.DataFrame, blob_name: str) -> str:
+    def df_to_parquet(self, dataframe: Union[pd.DataFrame, pa.Table], blob_name: str) -> str:
         """
         Converts a DataFrame to Parquet format and uploads it as a blob
         Args:
-            dataframe (pd.DataFrame): DataFrame to convert
+            dataframe (pd.DataFrame or pa.Table): DataFrame (or Arrow table, e.g. from parquet_to_arrow) to convert
             blob_name (str): Name for the Parquet blob (should end with .parquet)
         Returns:
             str: Message indicating result
         """
-        try:
-            # Create a memory buffer to store Parquet file
-            # Parquet is a compressed, efficient format for data storage
-            buffer = io.BytesIO()
-            
+        import pyarrow.parquet as pq
+        
+        # Create a temporary file to store Parquet file
+        # It stays in memory while small and moves to disk when it grows above _SPOOL_MAX_SIZE
+        # Parquet is a compressed, efficient format for data storage
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
             # Convert DataFrame to Parquet format and write to buffer
-            # index=False means don't include row numbers in Parquet
+            # The DataFrame is turned into an Arrow table without row numbers (same as index=False)
+            # An Arrow table is written directly - no detour through pandas and back
+            # compression='snappy' is a very fast compression - small files without slowing us down
             # Parquet files are smaller and faster to read than Excel
-            dataframe.to_parquet(buffer, index=False)
+            pq.write_table(_df_to_table(dataframe), buffer, compression='snappy')
             
-            # Reset buffer position to beginning
+            # Remember how many bytes we wrote, then reset position to beginning
             # Prepare the data for upload
+            length = buffer.tell()
             buffer.seek(0)
             
             # Upload the Parquet file to Azure blob storage
+            # We pass the buffer itself, so the data is not copied once more before upload
             # overwrite=True means replace file if it already exists
-            return self.upload_blob(blob_name, buffer.getvalue(), overwrite=True)
-        except Exception as e:
-            # If conversion or upload fails, provide clear error message
-            raise RuntimeError(f"Error converting DataFrame to Parquet: {str(e)}")
+            return self.upload_blob(blob_name, buffer, overwrite=True, length=length)
+
+# ======================================================================================================================================
+    # Create one Parquet file from many DataFrames - collects a batch of tables into a single file
+    
+    def dfs_to_parquet(self, dataframes: Dict[str, Union[pd.DataFrame, pa.Table]], blob_name: str,
+                       source_column: str = 'source_blob') -> str:
+        """
+        Writes many DataFrames with the same columns into one Parquet file and uploads it as a blob
+        Every DataFrame becomes its own row group, and a column with its name is added so rows can be traced back
+        Args:
+            dataframes (dict): Mapping of source name (e.g. the blob it was read from) to its DataFrame or Arrow table
+            blob_name (str): Name for the Parquet blob (should end with .parquet)
+            source_column (str): Name of the added column which holds the source name
+        Returns:
+            str: Message indicating result
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        if not dataframes:
+            raise ValueError("No DataFrames to write. Pass at least one DataFrame")
+        
+        # One file instead of many - the file is opened, described (header/footer) and uploaded only once
+        # Row groups are like chapters of one book: readers can skip a chapter using its statistics,
+        # e.g. read only the rows of one source_blob
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            writer = None
+            try:
+                for source_name, dataframe in dataframes.items():
+                    table = _df_to_table(dataframe)
+                    
+                    # The same value in every row - parquet stores it compressed as one dictionary entry
+                    table = table.append_column(source_column, pa.repeat(source_name, table.num_rows))
+                    
+                    # The first table decides the columns and their types for the whole file
+                    if writer is None:
+                        writer = pq.ParquetWriter(buffer, table.schema, compression='snappy')
+                    elif not table.schema.equals(writer.schema):
+                        # Small differences can be fixed by converting the table to the file's types,
+                        # e.g. a text column which is empty in this DataFrame has Arrow type "null"
+                        try:
+                            table = table.cast(writer.schema)
+                        except (ValueError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                            raise ValueError(
+                                f"DataFrame '{source_name}' has different columns or types than the first one. "
+                                f"Expected: {writer.schema.remove_metadata()}, got: {table.schema.remove_metadata()}"
+                            ) from e
+                    
+                    # row_group_size=num_rows keeps each DataFrame in exactly one row group
+                    writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            finally:
+                # Closing writes the parquet footer - without it the file can't be read
+                if writer is not None:
+                    writer.close()
+            
+            # Remember how many bytes we wrote, then reset position to beginning
+            length = buffer.tell()
+            buffer.seek(0)
+            
+            # Upload the Parquet file to Azure blob storage
+            # overwrite=True means replace file if it already exists
+            return self.upload_blob(blob_name, buffer, overwrite=True, length=length)
+
+# ======================================================================================================================================
+    # Create Feather files from DataFrames - converts pandas tables to Arrow IPC format
+    
+    def df_to_feather(self, dataframe: Union[pd.DataFrame, pa.Table], blob_name: str) -> str:
+        """
+        Converts a DataFrame to Feather (Arrow IPC) format and uploads it as a blob
+        Args:
+            dataframe (pd.DataFrame or pa.Table): DataFrame (or Arrow table) to convert
+            blob_name (str): Name for the Feather blob (should end with .feather or .arrow)
+        Returns:
+            str: Message indicating result
+        """
+        import pyarrow.feather as feather
+        
+        # Feather stores columns exactly as Arrow keeps them in memory
+        # Reading it back is almost just copying bytes - no parsing needed
+        # Row numbers are left out, same as index=False elsewhere
+        # An Arrow table is already in the right shape and is written as it is
+        table = _df_to_table(dataframe)
+        
+        # Create a temporary file to store Feather file (in memory while small, on disk when large)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            # compression='lz4' is extremely fast to compress and decompress
+            feather.write_feather(table, buffer, compression='lz4')
+            
+            # Remember how many bytes we wrote, then reset position to beginning
+            length = buffer.tell()
+            buffer.seek(0)
+            
+            # Upload the Feather file to Azure blob storage
+            # overwrite=True means replace file if it already exists
+            return self.upload_blob(blob_name, buffer, overwrite=True, length=length)
+
+# ======================================================================================================================================
+    # Save DataFrame in a chosen format - one entry point for all DataFrame writers
+    
+    def df_to_blob(self, dataframe: Union[pd.DataFrame, pa.Table], blob_name: str, file_format: str = 'parquet') -> str:
+        """
+        Converts a DataFrame to the chosen file format and uploads it as a blob
+        Parquet is the default - it is the fastest to write and the smallest for analytics
+        Args:
+            dataframe (pd.DataFrame or pa.Table): DataFrame to convert (Arrow tables work for every format)
+            blob_name (str): Name for the blob
+            file_format (str): One of 'parquet', 'feather', 'csv' or 'excel'
+        Returns:
+            str: Message indicating result
+        """
+        # Map every format name to the method which writes it
+        # Excel is still available, but only when asked for explicitly - it is by far the slowest
+        writers = {
+            'parquet': self.df_to_parquet,
+            'feather': self.df_to_feather,
+            'csv': self.df_to_csv,
+            'excel': self.df_to_excel,
+        }
+        
+        # Unknown format - tell the user which ones we support
+        if file_format not in writers:
+            raise ValueError(f"Unsupported file format '{file_format}'. Choose one of: {', '.join(writers)}")
+        return writers[file_format](dataframe, blob_name)
 
 # ======================================================================================================================================
     # Create DataFrames from CSV files - converts CSV files from Azure to pandas tables
     
-    def csv_to_df(self, blob_name: str) -> pd.DataFrame:
+    def csv_to_df(self, blob_name: str, use_arrow_dtypes: bool = False) -> pd.DataFrame:
         """
         Downloads a CSV file from blob storage and converts it to a pandas DataFrame
+        Differences from pd.read_csv:
+        - columns of ISO dates, timestamps and times are recognized automatically -
+          dates come back as datetime.date objects, timestamps as datetime64 and times as datetime.time (not as text)
+        - rows with fewer (or more) values than the header raise pyarrow.ArrowInvalid instead of being filled with NaN
+        Like pd.read_csv, an empty file raises pandas.errors.EmptyDataError and duplicate column names get .1, .2 ... suffixes
         Args:
             blob_name (str): Name of the CSV blob
+            use_arrow_dtypes (bool): Keep Arrow-backed pandas columns (pd.ArrowDtype) instead of NumPy ones
         Returns:
             pd.DataFrame: DataFrame containing the CSV data
         """
-        try:
-            # Download the CSV file from Azure as binary data
-            # CSV is a common text format for data storage
-            blob_data = self.download_blob(blob_name)
-            
-            # Convert binary data to pandas DataFrame
-            # io.BytesIO creates a file-like object from bytes in memory
-            # pd.read_csv reads comma-separated values and creates DataFrame
-            return pd.read_csv(io.BytesIO(blob_data))
-        except Exception as e:
-            # If conversion fails, provide clear error message
-            raise RuntimeError(f"Error converting CSV to DataFrame: {str(e)}")
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        
+        _configure_arrow_threads()
+        
+        # Download the CSV file from Azure into a bytearray of exactly the right size
+        # CSV is a common text format for data storage
+        # py_buffer wraps that memory without copying it, same as in parquet_to_arrow
+        buffer = pa.py_buffer(self._download_to_buffer(blob_name))
+        
+        # An empty file has no header to read - report it the same way pd.read_csv does
+        if buffer.size == 0:
+            raise pd.errors.EmptyDataError(f"No columns to parse from file '{blob_name}'")
+        
+        # pyarrow reads comma-separated values using all CPU cores
+        # The file is cut into blocks (block_size) and every core parses its own block
+        # This is like several people each reading a different chapter of the same book
+        # strings_can_be_null=True turns empty text cells into missing values, like pd.read_csv
+        # Different from pd.read_csv: text like 2024-01-31 or 2024-01-31 10:00:00 becomes a date/timestamp column
+        table = pacsv.read_csv(
+            pa.BufferReader(buffer),
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=_CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+        
+        # pyarrow keeps repeated column names as they are (a, a), pandas renames them (a, a.1)
+        # Renaming only changes labels, the column data is not touched
+        table = table.rename_columns(_dedup_column_names(table.column_names))
+        
+        # Convert the Arrow table to a DataFrame
+        # The table is only used here, so its memory can be released during conversion
+        return self.df_from_arrow(table, use_arrow_dtypes=use_arrow_dtypes, self_destruct=True)
 
 # ======================================================================================================================================
     # Create CSV files from DataFrames - converts pandas tables to CSV format and uploads to Azure
     
-    def df_to_csv(self, dataframe: pd.DataFrame, blob_name: str) -> str:
+    def df_to_csv(self, dataframe: Union[pd.DataFrame, pa.Table], blob_name: str) -> str:
         """
         Converts a DataFrame to CSV format and uploads it as a blob
         Args:
-            dataframe (pd.DataFrame): DataFrame to convert
+            dataframe (pd.DataFrame or pa.Table): DataFrame (or Arrow table) to convert
             blob_name (str): Name for the CSV blob (should end with .csv)
         Returns:
             str: Message indicating result
         """
-        try:
-            # Convert DataFrame to CSV format as string
+        # Create a temporary file to store CSV file (in memory while small, on disk when large)
+        # We write bytes directly, so pandas encodes text to UTF-8 while writing
+        # This skips building one big Python string which would then be encoded again by the SDK
+        import pyarrow as pa
+        
+        # Arrow tables are converted to pandas first, so a table and a DataFrame with the same data give the same file
+        # (pyarrow's own CSV writer quotes every text value and writes dates differently)
+        if isinstance(dataframe, pa.Table):
+            dataframe = self.df_from_arrow(dataframe)
+        
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            # Convert DataFrame to CSV format and write to buffer
             # index=False means don't include row numbers in CSV
             # CSV is human-readable text format with comma-separated values
-            csv_data = dataframe.to_csv(index=False)
+            dataframe.to_csv(buffer, index=False, encoding='utf-8')
+            
+            # Remember how many bytes we wrote, then reset position to beginning
+            # Prepare the data for upload
+            length = buffer.tell()
+            buffer.seek(0)
             
             # Upload the CSV data to Azure blob storage
+            # We pass the buffer itself, so the SDK reads it in chunks without another full copy
             # overwrite=True means replace file if it already exists
-            return self.upload_blob(blob_name, csv_data, overwrite=True)
+            return self.upload_blob(blob_name, buffer, overwrite=True, length=length)
+
+# ======================================================================================================================================
+
+
+class AzureBlobStorageAsync:
+    # Fixed list of attributes instead of a per-object dictionary, same as in AzureBlobStorage
+    __slots__ = (
+        'connection_string',
+        'container_name',
+        'max_concurrency',
+        'blob_service_client',
+        'container_client',
+    )
+
+    def __init__(self, connection_string: Optional[str] = None, container_name: Optional[str] = None,
+                 max_concurrency: int = _ASYNC_MAX_CONCURRENCY):
+        """
+        Initializes async connection to Azure Blob Storage
+        Use it with 'async with AzureBlobStorageAsync() as storage:' so connections are closed at the end
+        Args:
+            connection_string (str, optional): Azure storage connection string, recommended to use .env file
+            container_name (str, optional): Container name, recommended to use .env file
+            max_concurrency (int): Maximum number of downloads running at the same time
+        """
+        # Load environment variables from .env file (only parsed once per process)
+        env = _env()
+        
+        # Get connection details
+        # Priority: parameter value > environment variable > None
+        self.connection_string = connection_string or env.connection_string
+        self.container_name = container_name or env.container_name
+        self.max_concurrency = max_concurrency
+        
+        # Data validation
+        # If something is wrong with connection string or container name, return error
+        if not self.connection_string:
+            raise ValueError("Missing connection string. Check .env file or parameters")
+        if not self.container_name:
+            raise ValueError("Missing container name. Check .env file or parameters")
+        
+        try:
+            # Create async client (connection) to Azure Storage Account
+            # One client means one aiohttp connection pool shared by every download of this instance
+            # It is not cached at module level - aiohttp connections belong to one event loop
+            # and every asyncio.run() starts a brand new loop
+            self.blob_service_client = AsyncBlobServiceClient.from_connection_string(self.connection_string)
+            
+            # Create async client (connection) to specific container in Azure Storage
+            self.container_client = self.blob_service_client.get_container_client(self.container_name)
         except Exception as e:
-            # If conversion or upload fails, provide clear error message
-            raise RuntimeError(f"Error converting DataFrame to CSV: {str(e)}")
+            # If connection fails, report error with information about what went wrong
+            raise ConnectionError(f"Failed to connect to Azure Storage: {str(e)}")
+
+# ======================================================================================================================================
+    # Opening and closing - makes sure network connections are released
+    
+    async def __aenter__(self) -> "AzureBlobStorageAsync":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the async client and its network connections
+        """
+        # Like hanging up the phone when the conversation is over
+        await self.blob_service_client.close()
+
+# ======================================================================================================================================
+    # Download blob - gets one file from Azure storage without blocking
+    
+    async def download_blob(self, blob_name: str) -> bytes:
+        """
+        Downloads a blob's content
+        Args:
+            blob_name (str): Name of the blob to download
+        Returns:
+            bytes: Blob content
+        """
+        # Start the download and wait (await) for the whole content
+        # While we wait, other downloads can use the time
+        downloader = await self.container_client.get_blob_client(blob_name).download_blob()
+        return await downloader.readall()
 
 # ======================================================================================================================================
+    # Download many blobs - gets a whole batch of files at the same time
+    
+    async def download_many(self, blob_names: List[str]) -> Dict[str, bytes]:
+        """
+        Downloads many blobs concurrently
+        Args:
+            blob_names (list): Names of the blobs to download
+        Returns:
+            dict: Mapping of blob name to its content (bytes)
+        """
+        # Semaphore works like a limited number of tickets
+        # Only max_concurrency downloads can hold a ticket and run at the same time
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _download_one(blob_name: str) -> bytes:
+            async with semaphore:
+                return await self.download_blob(blob_name)
+        
+        # Start all downloads and wait until every one of them has finished
+        # Total time is close to the slowest download instead of the sum of all of them
+        contents = await asyncio.gather(*[_download_one(blob_name) for blob_name in blob_names])
+        return dict(zip(blob_names, contents))
 
 # ======================================================================================================================================
+    # Read many parquet files - downloads and converts a batch of files at the same time
+    
+    async def read_parquet_many(self, blob_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Downloads many parquet blobs concurrently and converts each of them to a pandas DataFrame
+        Args:
+            blob_names (list): Names of the parquet blobs
+        Returns:
+            dict: Mapping of blob name to its DataFrame
+        """
+        # Same "tickets" idea as in download_many - only max_concurrency downloads at once
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _read_one(blob_name: str) -> pd.DataFrame:
+            async with semaphore:
+                data = await self.download_blob(blob_name)
+            
+            # Converting is CPU work, so it runs in a worker thread
+            # Meanwhile the event loop keeps downloading other files - the network and the CPU work at the same time
+            # The ticket is already returned, so the next download doesn't wait for this conversion
+            return await asyncio.to_thread(_parquet_bytes_to_df, data)
+        
+        frames = await asyncio.gather(*[_read_one(blob_name) for blob_name in blob_names])
+        return dict(zip(blob_names, frames))
 
 # ======================================================================================================================================
\ No newline at end of file